@@ -1,14 +1,26 @@
 # PROJECT OVERSEER - Modules Package
 # Passive Reconnaissance Toolset
 
-from .ct_enum import CTLogEnumerator
-from .dns_resolver import DNSResolver
-from .geo_intel import GeoIntelligence
-from .map_generator import TacticalMapGenerator
+import importlib
+
+# Public name -> submodule. Loaded on first attribute access (PEP 562) so
+# importing one module doesn't drag in the others (folium alone is ~300ms)
+_EXPORTS = {
+    'CTLogEnumerator': '.ct_enum',
+    'DNSResolver': '.dns_resolver',
+    'GeoIntelligence': '.geo_intel',
+    'TacticalMapGenerator': '.map_generator',
+}
 
 __all__ = [
     'CTLogEnumerator',
-    'DNSResolver', 
+    'DNSResolver',
     'GeoIntelligence',
     'TacticalMapGenerator'
 ]
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,43 +6,276 @@ No packets sent to target - 100% OPSEC safe
 Sources: crt.sh, CertSpotter, HackerTarget
 """
 
-import requests
+import aiohttp
+import asyncio
+import hashlib
+import ijson
+import multiprocessing
+import orjson
+import os
 import re
+import tempfile
 import time
-from typing import Set, Optional
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import AsyncIterator, BinaryIO, List, Set, Optional
 from rich.console import Console
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
+
+from .http_session import get_session, close_session
 
 console = Console()
 
+# Hostname sanity check - alphanumeric, hyphens, dots only
+_SUBDOMAIN_RE = re.compile(r'^[a-z0-9][a-z0-9\-.]*[a-z0-9]$')
+
+
+def _clean_name(name: str, domain: str) -> Optional[str]:
+    """Normalize one CT name, returning it only if it is a valid subdomain of domain"""
+    # Remove whitespace
+    name = name.strip().lower()
+    
+    # Skip wildcards
+    if name[:2] == '*.':
+        name = name[2:]
+    
+    # Validate it's actually a subdomain of our target - the dot matters,
+    # otherwise 'evilgoogle.com' would pass for 'google.com'. This also
+    # skips the bare base domain.
+    if not name.endswith('.' + domain):
+        return None
+    
+    # Basic validation - alphanumeric, hyphens, dots only
+    if not _SUBDOMAIN_RE.match(name):
+        return None
+    
+    return name
+
+
+def _clean_batch(names: List[str], domain: str) -> Set[str]:
+    """Clean a shard of raw names (module level so worker processes can unpickle it)"""
+    return set(filter(None, (_clean_name(name, domain) for name in names)))
+
+
+def _read_crtsh_names(fh: BinaryIO) -> Set[str]:
+    """
+    Stream the raw name_value entries out of a crt.sh body (blocking - run
+    off the event loop). Takes ownership of fh and closes it.
+    
+    Raises:
+        ValueError / ijson.JSONError: Body is not valid JSON
+    """
+    # crt.sh repeats the same SANs across many certificates - dedupe raw
+    # names first so each unique string is cleaned exactly once
+    raw_names: Set[str] = set()
+    
+    with fh:
+        # Empty or blank body means no certificates
+        while (first := fh.read(1)) and first.isspace():
+            pass
+        if not first:
+            return raw_names
+        fh.seek(-1, os.SEEK_CUR)
+        
+        # Stream name_value fields one by one - popular domains return
+        # hundreds of MB of JSON that never needs to be held in memory
+        for name_value in ijson.items(fh, 'item.name_value'):
+            raw_names.update(name_value.lower().split('\n'))
+    
+    return raw_names
+
+
+# Start method for the cleaning pool - forkserver where the platform has it
+_POOL_START_METHOD = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+
+
+class CrtShTransient(aiohttp.ClientError):
+    """crt.sh answered 503 - the only HTTP status worth retrying"""
+
+
+def _log_crtsh_retry(retry_state):
+    """tenacity before_sleep hook - report the retry on the console"""
+    console.print(
+        f"[yellow][!] crt.sh unavailable (attempt {retry_state.attempt_number}/{CTLogEnumerator.MAX_RETRIES}), "
+        f"retrying in {retry_state.next_action.sleep:.0f}s[/yellow]"
+    )
+
+
+class _CacheEntry:
+    """
+    A response body being spooled to disk.
+    Cacheable bodies land in a temp file next to their final cache path and
+    are published atomically on commit(); the rest go to an anonymous file.
+    """
+    
+    def __init__(self, path: Optional[Path], ttl: int):
+        self._path = path
+        self._tmp: Optional[str] = None
+        
+        if path is not None:
+            fd, self._tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix='.tmp')
+            self.fh: BinaryIO = os.fdopen(fd, 'w+b')
+        else:
+            self.fh = tempfile.TemporaryFile()
+        
+        self.fh.write(orjson.dumps({'ts': time.time(), 'ttl': ttl}) + b'\n')
+    
+    def write(self, chunk: bytes):
+        self.fh.write(chunk)
+    
+    def abort(self):
+        """Throw away a partial download"""
+        self.fh.close()
+        if self._tmp is not None:
+            os.unlink(self._tmp)
+    
+    def commit(self) -> BinaryIO:
+        """Publish the entry and return it opened for reading at the body"""
+        self.fh.flush()
+        if self._tmp is not None:
+            # Atomic swap - readers never see a half-written entry
+            os.replace(self._tmp, self._path)
+        self.fh.seek(0)
+        self.fh.readline()
+        return self.fh
+
+
+class _CachedHTTP:
+    """
+    Minimal on-disk cache for CT source responses, keyed by (source, domain).
+    Each entry is a JSON metadata line followed by the raw response body.
+    Lives in a private per-user directory - entries under a shared tempdir
+    with predictable names could be planted by any other local user.
+    """
+    
+    CACHE_DIR = Path('~/.cache/overseer/ct').expanduser()
+    
+    def __init__(self, ttl: int):
+        self.ttl = ttl
+    
+    def _path(self, source: str, domain: str) -> Path:
+        key = hashlib.sha1(f"{source}|{domain}".encode()).hexdigest()
+        return self.CACHE_DIR / key
+    
+    def open(self, source: str, domain: str) -> Optional[BinaryIO]:
+        """Return the cached entry opened at the body if still fresh, else None"""
+        if self.ttl <= 0:
+            return None
+        
+        path = self._path(source, domain)
+        now = time.time()
+        
+        try:
+            # Cheap mtime check before opening anything
+            if os.path.getmtime(path) <= now - self.ttl:
+                return None
+            
+            fh = open(path, 'rb')
+        except OSError:
+            return None
+        
+        try:
+            meta = orjson.loads(fh.readline())
+            if meta['ts'] + meta['ttl'] > now:
+                return fh
+        except (ValueError, KeyError):
+            pass
+        
+        fh.close()
+        return None
+    
+    def new_entry(self, source: str, domain: str, cache_control: Optional[str] = None) -> _CacheEntry:
+        """Start spooling a fresh body, honoring the server's Cache-Control"""
+        ttl = self.ttl
+        if cache_control:
+            if 'no-store' in cache_control:
+                ttl = 0
+            max_age = re.search(r'max-age=(\d+)', cache_control)
+            if max_age:
+                ttl = min(ttl, int(max_age.group(1)))
+        
+        if ttl > 0:
+            try:
+                self.CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+                # mkdir's mode is masked by umask and skipped if the dir exists
+                self.CACHE_DIR.chmod(0o700)
+                return _CacheEntry(self._path(source, domain), ttl)
+            except OSError:
+                pass
+        
+        return _CacheEntry(None, 0)
+    
+    def discard(self, source: str, domain: str):
+        """Drop an entry (e.g. the cached body turned out to be garbage)"""
+        self._path(source, domain).unlink(missing_ok=True)
+
 
 class CTLogEnumerator:
     """
     Enumerates subdomains from Certificate Transparency logs.
     Uses multiple public databases - no active scanning.
-    Includes retry logic and fallback sources.
+    All sources are queried concurrently and their results merged.
     """
     
     # Primary source
     CRT_SH_URL = "https://crt.sh/?q={domain}&output=json"
     
-    # Fallback sources
+    # Supplementary sources
     CERTSPOTTER_URL = "https://api.certspotter.com/v1/issuances?domain={domain}&include_subdomains=true&expand=dns_names"
     HACKERTARGET_URL = "https://api.hackertarget.com/hostsearch/?q={domain}"
     
+    # Optional source - Facebook's CT monitor needs a Graph API app token
+    FACEBOOK_URL = "https://graph.facebook.com/certificates"
+    FACEBOOK_TOKEN_ENV = "OVERSEER_FB_TOKEN"
+    FACEBOOK_MAX_PAGES = 10  # 1000 certificates per page
+    
     MAX_RETRIES = 3
-    RETRY_DELAY = 2  # seconds
+    CHUNK_SIZE = 64 * 1024  # bytes per read when spooling responses
+    PARALLEL_CLEAN_THRESHOLD = 5000  # raw names before cleaning is sharded across processes
     
-    def __init__(self, timeout: int = 30):
+    def __init__(self,
+                 timeout: int = 30,
+                 cache_ttl: int = 21600,
+                 session: Optional[aiohttp.ClientSession] = None,
+                 facebook_token: Optional[str] = None):
+        """
+        Initialize CT enumerator.
+        
+        Args:
+            timeout: HTTP connect and per-read timeout in seconds
+            cache_ttl: Seconds to reuse cached source responses (0 disables)
+            session: Shared HTTP session (default: the process-wide one)
+            facebook_token: Graph API token ('app_id|app_secret') enabling
+                Facebook's CT monitor (default: $OVERSEER_FB_TOKEN)
+        """
         self.timeout = timeout
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        })
+        # Per connect/read, not per download - crt.sh bodies for large
+        # targets stream for minutes but never stall for `timeout` seconds
+        self._timeout = aiohttp.ClientTimeout(total=None, sock_connect=timeout, sock_read=timeout)
+        self._session = session
+        self._cache = _CachedHTTP(cache_ttl)
+        self._fb_token = facebook_token or os.environ.get(self.FACEBOOK_TOKEN_ENV)
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Injected session if usable, else the shared one"""
+        if self._session is not None and not self._session.closed:
+            return self._session
+        return await get_session()
+    
+    def _run(self, coro):
+        """Run a coroutine to completion from sync code, then clean up"""
+        async def _wrapped():
+            try:
+                return await coro
+            finally:
+                await close_session()
+        
+        return asyncio.run(_wrapped())
     
     def enumerate(self, domain: str) -> Set[str]:
         """
-        Query multiple CT log sources for subdomains.
-        Uses fallback sources if primary fails.
+        Blocking wrapper around enumerate_async() for CLI usage.
         
         Args:
             domain: Target domain (e.g., 'tesla.com')
@@ -50,168 +283,264 @@ class CTLogEnumerator:
         Returns:
             Set of unique subdomains found
         """
+        return self._run(self.enumerate_async(domain))
+    
+    async def enumerate_async(self, domain: str) -> Set[str]:
+        """
+        Query all CT log sources concurrently for subdomains.
+        
+        Args:
+            domain: Target domain (e.g., 'tesla.com')
+            
+        Returns:
+            Set of unique subdomains found
+        """
+        return {sub async for sub in self.iter_subdomains(domain)}
+    
+    async def iter_subdomains(self, domain: str) -> AsyncIterator[str]:
+        """
+        Yield unique subdomains as each CT log source completes.
+        Sources are queried concurrently, so consumers can start working
+        on the fastest source's names while slower ones are still running.
+        
+        Args:
+            domain: Target domain (e.g., 'tesla.com')
+            
+        Yields:
+            Each unique subdomain, once
+        """
         console.print(f"[cyan][*] Querying Certificate Transparency Logs for [bold]{domain}[/bold]...[/cyan]")
         
         subdomains: Set[str] = set()
         
-        # Try crt.sh first (most comprehensive)
-        crt_results = self._query_crtsh(domain)
-        subdomains.update(crt_results)
+        # Fan out to every source at once - the first to answer feeds downstream
+        queries = [self._query_crtsh, self._query_certspotter, self._query_hackertarget]
+        if self._fb_token:
+            queries.append(self._query_facebook)
+        tasks = [asyncio.ensure_future(query(domain)) for query in queries]
         
-        # Try CertSpotter as fallback/supplement
-        if len(subdomains) < 10:
-            console.print("[cyan][*] Trying CertSpotter as additional source...[/cyan]")
-            certspotter_results = self._query_certspotter(domain)
-            subdomains.update(certspotter_results)
-        
-        # Try HackerTarget as last resort
-        if len(subdomains) < 5:
-            console.print("[cyan][*] Trying HackerTarget as fallback...[/cyan]")
-            hackertarget_results = self._query_hackertarget(domain)
-            subdomains.update(hackertarget_results)
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    result = await next_done
+                except Exception as e:
+                    console.print(f"[dim][CT] Query failed: {e}[/dim]")
+                    continue
+                
+                new = result - subdomains
+                subdomains.update(new)
+                for sub in new:
+                    yield sub
+        finally:
+            # Consumer stopped early - don't leave sources running
+            for task in tasks:
+                task.cancel()
         
         if subdomains:
             console.print(f"[green][+] Found [bold]{len(subdomains)}[/bold] unique subdomains in CT Logs[/green]")
         else:
             console.print("[yellow][!] No subdomains found across all CT sources[/yellow]")
+    
+    async def _query_crtsh(self, domain: str) -> Set[str]:
+        """Query crt.sh (transient failures are retried by _fetch_crtsh)"""
+        subdomains: Set[str] = set()
+        
+        try:
+            fh = await self._fetch_crtsh(domain)
+        except CrtShTransient:
+            console.print(f"[yellow][!] crt.sh unavailable after {self.MAX_RETRIES} attempts[/yellow]")
+            return subdomains
+        except asyncio.TimeoutError:
+            console.print(f"[yellow][!] crt.sh timeout after {self.MAX_RETRIES} attempts[/yellow]")
+            return subdomains
+        except aiohttp.ClientError as e:
+            console.print(f"[yellow][!] crt.sh error: {e}[/yellow]")
+            return subdomains
+        
+        # Parsing ~100MB of JSON takes seconds - keep it off the event loop
+        # so DNS workers keep resolving what the other sources found
+        try:
+            raw_names = await asyncio.to_thread(_read_crtsh_names, fh)
+        except (ValueError, ijson.JSONError):
+            console.print("[yellow][!] Invalid JSON from crt.sh[/yellow]")
+            self._cache.discard('crt.sh', domain)
+            return subdomains
+        
+        subdomains = await self._clean_names(raw_names, domain)
         
+        console.print(f"[dim][crt.sh] Found {len(subdomains)} subdomains[/dim]")
         return subdomains
     
-    def _query_crtsh(self, domain: str) -> Set[str]:
-        """Query crt.sh with retry logic"""
-        subdomains: Set[str] = set()
+    @retry(
+        stop=stop_after_attempt(MAX_RETRIES),
+        wait=wait_exponential(multiplier=1, max=10),
+        retry=retry_if_exception_type((CrtShTransient, asyncio.TimeoutError)),
+        before_sleep=_log_crtsh_retry,
+        reraise=True
+    )
+    async def _fetch_crtsh(self, domain: str) -> BinaryIO:
+        """Fetch the raw crt.sh body, raising CrtShTransient on 503"""
+        try:
+            return await self._fetch('crt.sh', domain, self.CRT_SH_URL.format(domain=domain))
+        except aiohttp.ClientResponseError as e:
+            # Anything other than 503 is not worth retrying
+            if e.status == 503:
+                raise CrtShTransient("crt.sh returned 503") from e
+            raise
+    
+    async def _fetch(self, source: str, domain: str, url: str) -> BinaryIO:
+        """
+        GET a source URL, serving from and populating the on-disk cache.
+        The body is spooled to disk in chunks and returned as an open file.
+        """
+        cached = self._cache.open(source, domain)
+        if cached is not None:
+            return cached
         
-        for attempt in range(self.MAX_RETRIES):
+        session = await self._get_session()
+        async with session.get(url, timeout=self._timeout) as response:
+            response.raise_for_status()
+            
+            entry = self._cache.new_entry(source, domain, response.headers.get('Cache-Control'))
             try:
-                response = self.session.get(
-                    self.CRT_SH_URL.format(domain=domain),
-                    timeout=self.timeout
-                )
-                
-                if response.status_code == 503:
-                    console.print(f"[yellow][!] crt.sh unavailable (attempt {attempt + 1}/{self.MAX_RETRIES})[/yellow]")
-                    if attempt < self.MAX_RETRIES - 1:
-                        time.sleep(self.RETRY_DELAY * (attempt + 1))
-                    continue
-                
-                response.raise_for_status()
-                
-                if not response.text.strip():
-                    return subdomains
-                
-                data = response.json()
-                
-                for entry in data:
-                    name_value = entry.get('name_value', '')
-                    names = name_value.split('\n')
-                    
-                    for name in names:
-                        clean_name = self._clean_subdomain(name, domain)
-                        if clean_name:
-                            subdomains.add(clean_name)
-                
-                console.print(f"[dim][crt.sh] Found {len(subdomains)} subdomains[/dim]")
-                return subdomains
-                
-            except requests.exceptions.Timeout:
-                console.print(f"[yellow][!] crt.sh timeout (attempt {attempt + 1}/{self.MAX_RETRIES})[/yellow]")
-                if attempt < self.MAX_RETRIES - 1:
-                    time.sleep(self.RETRY_DELAY)
-            except requests.exceptions.RequestException as e:
-                console.print(f"[yellow][!] crt.sh error: {e}[/yellow]")
-                break
-            except ValueError:
-                console.print("[yellow][!] Invalid JSON from crt.sh[/yellow]")
-                break
+                async for chunk in response.content.iter_chunked(self.CHUNK_SIZE):
+                    entry.write(chunk)
+            except BaseException:
+                entry.abort()
+                raise
         
-        return subdomains
+        return entry.commit()
     
-    def _query_certspotter(self, domain: str) -> Set[str]:
+    async def _query_certspotter(self, domain: str) -> Set[str]:
         """Query CertSpotter API"""
         subdomains: Set[str] = set()
         
         try:
-            response = self.session.get(
-                self.CERTSPOTTER_URL.format(domain=domain),
-                timeout=self.timeout
-            )
-            response.raise_for_status()
-            
-            data = response.json()
+            with await self._fetch('CertSpotter', domain, self.CERTSPOTTER_URL.format(domain=domain)) as fh:
+                # orjson parses the whole buffer in one C pass (~3x stdlib json)
+                data = orjson.loads(fh.read())
             
-            for entry in data:
-                dns_names = entry.get('dns_names', [])
-                for name in dns_names:
-                    clean_name = self._clean_subdomain(name, domain)
-                    if clean_name:
-                        subdomains.add(clean_name)
+            # filter(None, ...) drops rejected names without a Python-level if
+            subdomains.update(filter(None, (
+                self._clean_subdomain(name, domain)
+                for entry in data
+                for name in entry.get('dns_names', [])
+            )))
             
             if subdomains:
                 console.print(f"[dim][CertSpotter] Found {len(subdomains)} subdomains[/dim]")
                 
         except Exception as e:
             console.print(f"[dim][CertSpotter] Query failed: {e}[/dim]")
+            self._cache.discard('CertSpotter', domain)
         
         return subdomains
     
-    def _query_hackertarget(self, domain: str) -> Set[str]:
-        """Query HackerTarget API"""
+    async def _query_facebook(self, domain: str) -> Set[str]:
+        """Query Facebook's CT monitor (Graph API, cursor-paginated)"""
         subdomains: Set[str] = set()
         
+        url = self.FACEBOOK_URL
+        params = {'query': domain, 'fields': 'domains', 'limit': '1000', 'access_token': self._fb_token}
+        
         try:
-            response = self.session.get(
-                self.HACKERTARGET_URL.format(domain=domain),
-                timeout=self.timeout
-            )
-            response.raise_for_status()
-            
-            # HackerTarget returns plaintext: subdomain,IP
-            lines = response.text.strip().split('\n')
+            session = await self._get_session()
+            for _ in range(self.FACEBOOK_MAX_PAGES):
+                async with session.get(url, params=params, timeout=self._timeout) as response:
+                    response.raise_for_status()
+                    data = orjson.loads(await response.read())
+                
+                subdomains.update(filter(None, (
+                    self._clean_subdomain(name, domain)
+                    for entry in data.get('data', [])
+                    for name in entry.get('domains', [])
+                )))
+                
+                # 'next' is a complete URL - cursor and token included
+                url = data.get('paging', {}).get('next')
+                if not url:
+                    break
+                params = None
             
-            for line in lines:
-                if ',' in line and 'error' not in line.lower():
-                    subdomain = line.split(',')[0].strip()
-                    clean_name = self._clean_subdomain(subdomain, domain)
-                    if clean_name:
-                        subdomains.add(clean_name)
+            if subdomains:
+                console.print(f"[dim][Facebook CT] Found {len(subdomains)} subdomains[/dim]")
+        
+        # Never echo the exception text - it carries the URL, token and all
+        except aiohttp.ClientResponseError as e:
+            console.print(f"[dim][Facebook CT] Query failed: HTTP {e.status}[/dim]")
+        except Exception as e:
+            console.print(f"[dim][Facebook CT] Query failed: {type(e).__name__}[/dim]")
+        
+        return subdomains
+    
+    async def _query_hackertarget(self, domain: str) -> Set[str]:
+        """Query HackerTarget API"""
+        subdomains: Set[str] = set()
+        
+        try:
+            with await self._fetch('HackerTarget', domain, self.HACKERTARGET_URL.format(domain=domain)) as fh:
+                # HackerTarget returns plaintext: subdomain,IP - walk it row by
+                # row and only decode the hostname column
+                rows = (
+                    line.split(b',', 1)[0].decode('utf-8', errors='replace')
+                    for line in fh
+                    if b',' in line and b'error' not in line.lower()
+                )
+                subdomains.update(filter(None, (self._clean_subdomain(name, domain) for name in rows)))
             
             if subdomains:
                 console.print(f"[dim][HackerTarget] Found {len(subdomains)} subdomains[/dim]")
+            else:
+                # Quota/error notices come back as 200 - don't pin them in the cache
+                self._cache.discard('HackerTarget', domain)
                 
         except Exception as e:
             console.print(f"[dim][HackerTarget] Query failed: {e}[/dim]")
         
         return subdomains
     
-    def _clean_subdomain(self, name: str, domain: str) -> Optional[str]:
+    async def _clean_names(self, raw_names: Set[str], domain: str) -> Set[str]:
         """
-        Clean and validate subdomain entries.
-        Removes wildcards and validates domain suffix.
+        Clean raw CT names off the event loop - in a worker thread, or
+        sharded across worker processes for large sets.
         """
-        # Remove whitespace
-        name = name.strip().lower()
+        nproc = os.cpu_count() or 1
+        if nproc == 1 or len(raw_names) <= self.PARALLEL_CLEAN_THRESHOLD:
+            return await asyncio.to_thread(_clean_batch, list(raw_names), domain)
         
-        # Skip wildcards
-        if name.startswith('*'):
-            name = name.replace('*.', '')
-        
-        # Validate it's actually a subdomain of our target
-        if not name.endswith(domain):
-            return None
-        
-        # Skip if it's just the base domain
-        if name == domain:
-            return None
+        raw_list = list(raw_names)
+        chunks = [raw_list[i::nproc] for i in range(nproc)]
+        loop = asyncio.get_running_loop()
+        pool: Optional[ProcessPoolExecutor] = None
         
-        # Basic validation - alphanumeric, hyphens, dots only
-        if not re.match(r'^[a-z0-9][a-z0-9\-\.]*[a-z0-9]$', name):
-            return None
+        try:
+            # Never fork this process - it already runs threads (to_thread
+            # workers, c-ares) and a forked child can deadlock on their locks
+            pool = ProcessPoolExecutor(nproc, mp_context=multiprocessing.get_context(_POOL_START_METHOD))
+            parts = await asyncio.gather(*(
+                loop.run_in_executor(pool, _clean_batch, chunk, domain) for chunk in chunks
+            ))
+        except (OSError, BrokenProcessPool) as e:
+            # No process support (sandboxes, some containers) - clean in a thread
+            console.print(f"[dim][CT] Process pool unavailable ({e}) - cleaning inline[/dim]")
+            parts = [await asyncio.to_thread(_clean_batch, raw_list, domain)]
+        finally:
+            # Never join workers on the loop - by now the results are in or no
+            # longer wanted (cancelled), so drop queued shards and let them exit
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
         
-        return name
-
+        return set().union(*parts)
+    
+    def _clean_subdomain(self, name: str, domain: str) -> Optional[str]:
+        """
+        Clean and validate subdomain entries.
+        Removes wildcards and validates domain suffix.
+        """
+        return _clean_name(name, domain)
 
 if __name__ == "__main__":
-    # Module test
+    # Module test (run as: python -m modules.ct_enum)
     enumerator = CTLogEnumerator()
     subs = enumerator.enumerate("tesla.com")
     print(f"\nSample subdomains: {list(subs)[:10]}")
@@ -5,18 +5,18 @@ Resolves subdomains to IPv4 addresses using public DNS
 Identifies live hosts vs dead domains
 """
 
-import dns.resolver
-import socket
-from typing import Dict, Optional, List
+import aiodns
+import asyncio
+from collections import deque
+from typing import Collection, Dict, Optional, List
 from dataclasses import dataclass
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from rich.console import Console
 from tqdm import tqdm
 
 console = Console()
 
 
-@dataclass
+@dataclass(slots=True)
 class DNSResult:
     """Container for DNS resolution results"""
     subdomain: str
@@ -26,40 +26,168 @@ class DNSResult:
     error: Optional[str] = None
 
 
+class _AdaptiveLimit:
+    """
+    AIMD window on in-flight DNS queries. Every WINDOW completions the
+    timeout rate over the last WINDOW queries is checked: below LOW_ERROR
+    (with callers queuing) the window grows by GROW, above HIGH_ERROR it
+    shrinks by SHRINK. A fixed limit is minimum == initial == maximum.
+    """
+    
+    WINDOW = 200
+    LOW_ERROR = 0.01
+    HIGH_ERROR = 0.05
+    GROW = 1.25
+    SHRINK = 0.7
+    
+    def __init__(self, initial: int, minimum: int, maximum: int):
+        self.limit = initial
+        self.minimum = minimum
+        self.maximum = maximum
+        self._in_flight = 0
+        self._waiters: deque = deque()
+        self._outcomes: deque = deque(maxlen=self.WINDOW)
+        self._since_adjust = 0
+        self._saturated = False
+    
+    async def acquire(self):
+        """Wait for a free slot in the window"""
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            return
+        
+        self._saturated = True
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            # Slot was handed over just as we were cancelled - give it back
+            if waiter.done() and not waiter.cancelled():
+                self._in_flight -= 1
+                self._wake()
+            raise
+    
+    def release(self, failed: bool):
+        """Free a slot, recording whether the query timed out"""
+        self._in_flight -= 1
+        self._outcomes.append(failed)
+        self._since_adjust += 1
+        if self._since_adjust >= self.WINDOW:
+            self._adjust()
+        self._wake()
+    
+    def _adjust(self):
+        error_rate = sum(self._outcomes) / len(self._outcomes)
+        if error_rate > self.HIGH_ERROR:
+            self.limit = max(self.minimum, int(self.limit * self.SHRINK))
+        elif error_rate < self.LOW_ERROR and (self._saturated or self._waiters):
+            self.limit = min(self.maximum, max(self.limit + 1, int(self.limit * self.GROW)))
+        self._since_adjust = 0
+        self._saturated = False
+    
+    def _wake(self):
+        """Hand free slots to queued callers, oldest first"""
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._in_flight += 1
+                waiter.set_result(None)
+
+
 class DNSResolver:
     """
-    High-performance DNS resolver with threading support.
-    Uses dnspython for reliable resolution.
+    High-performance async DNS resolver.
+    Uses aiodns (c-ares) so thousands of queries can be in flight
+    from a single thread.
     """
     
+    # c-ares error codes mapped to the labels we report
+    _ERRORS = {
+        aiodns.error.ARES_ENOTFOUND: 'NXDOMAIN',
+        aiodns.error.ARES_ENODATA: 'NoAnswer',
+        aiodns.error.ARES_ETIMEOUT: 'Timeout',
+    }
+    
+    # --threads auto: start here, adapt between a quarter and 4x of it
+    AUTO_WORKERS = 128
+    
     def __init__(self, 
                  timeout: float = 3.0,
-                 max_workers: int = 50,
+                 max_workers: Optional[int] = None,
                  nameservers: Optional[List[str]] = None):
         """
         Initialize DNS resolver.
         
         Args:
             timeout: DNS query timeout in seconds
-            max_workers: Max concurrent DNS queries
+            max_workers: Max concurrent DNS queries (None: auto-tune on timeouts)
             nameservers: Custom nameservers (default: Cloudflare + Google)
         """
         self.timeout = timeout
-        self.max_workers = max_workers
         
-        # Configure resolver
-        self.resolver = dns.resolver.Resolver()
-        self.resolver.timeout = timeout
-        self.resolver.lifetime = timeout
+        # (initial, minimum, maximum) in-flight queries
+        if max_workers is None:
+            self._limits = (self.AUTO_WORKERS, self.AUTO_WORKERS // 4, self.AUTO_WORKERS * 4)
+        else:
+            self._limits = (max_workers, max_workers, max_workers)
+        # Upper bound on concurrency - callers size worker pools with this
+        self.max_workers = self._limits[2]
         
         # Use fast public DNS
-        self.resolver.nameservers = nameservers or [
+        self.nameservers = nameservers or [
             '1.1.1.1',      # Cloudflare
             '8.8.8.8',      # Google
             '9.9.9.9',      # Quad9
         ]
+        
+        # c-ares channels (and the window's futures) are bound to an event
+        # loop - created on first use
+        self._resolver: Optional[aiodns.DNSResolver] = None
+        self._limit: Optional[_AdaptiveLimit] = None
+        self._limit_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    def _get_resolver(self) -> aiodns.DNSResolver:
+        """Return the resolver for the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._resolver is None or self._resolver.loop is not loop:
+            self._resolver = aiodns.DNSResolver(
+                nameservers=self.nameservers,
+                loop=loop,
+                timeout=self.timeout,
+                tries=1
+            )
+        return self._resolver
+    
+    def _get_limit(self) -> _AdaptiveLimit:
+        """Return the concurrency window for the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._limit_loop is not loop:
+            self._limit_loop = loop
+            self._limit = _AdaptiveLimit(*self._limits)
+        return self._limit
+    
+    async def close(self):
+        """Release the c-ares channel"""
+        if self._resolver is not None:
+            await self._resolver.close()
+        self._resolver = None
+    
+    def _run(self, coro):
+        """Run a coroutine to completion from sync code, then clean up"""
+        async def _wrapped():
+            try:
+                return await coro
+            finally:
+                await self.close()
+        
+        return asyncio.run(_wrapped())
     
     def resolve_single(self, subdomain: str) -> DNSResult:
+        """Blocking wrapper around resolve_single_async()"""
+        return self._run(self.resolve_single_async(subdomain))
+    
+    async def resolve_single_async(self, subdomain: str) -> DNSResult:
         """
         Resolve a single subdomain to its IP.
         
@@ -69,41 +197,56 @@ class DNSResolver:
         Returns:
             DNSResult with resolution details
         """
+        limit = self._get_limit()
+        await limit.acquire()
+        
+        result = None
         try:
-            # Try A record first
-            answers = self.resolver.resolve(subdomain, 'A')
-            ip = str(answers[0])
-            
-            # Check for CNAME (useful for CDN detection)
-            cname = None
-            try:
-                cname_answers = self.resolver.resolve(subdomain, 'CNAME')
-                cname = str(cname_answers[0])
-            except:
-                pass
-            
-            return DNSResult(
-                subdomain=subdomain,
-                ip=ip,
-                is_alive=True,
-                cname=cname
-            )
-            
-        except dns.resolver.NXDOMAIN:
-            return DNSResult(subdomain=subdomain, ip=None, is_alive=False, error='NXDOMAIN')
-        except dns.resolver.NoAnswer:
-            return DNSResult(subdomain=subdomain, ip=None, is_alive=False, error='NoAnswer')
-        except dns.resolver.Timeout:
-            return DNSResult(subdomain=subdomain, ip=None, is_alive=False, error='Timeout')
-        except Exception as e:
-            return DNSResult(subdomain=subdomain, ip=None, is_alive=False, error=str(e))
-    
-    def resolve_bulk(self, subdomains: List[str], show_progress: bool = True) -> Dict[str, DNSResult]:
+            result = await self._query(subdomain)
+            return result
+        finally:
+            limit.release(failed=result is None or result.error == 'Timeout')
+    
+    async def _query(self, subdomain: str) -> DNSResult:
+        """Issue the A + CNAME lookups for one name"""
+        resolver = self._get_resolver()
+        
+        # A and CNAME in parallel - one round-trip per host instead of two
+        a_answers, cname_answer = await asyncio.gather(
+            resolver.query(subdomain, 'A'),
+            resolver.query(subdomain, 'CNAME'),
+            return_exceptions=True
+        )
+        
+        if isinstance(a_answers, aiodns.error.DNSError):
+            code = a_answers.args[0] if a_answers.args else None
+            error = self._ERRORS.get(code, str(a_answers))
+            return DNSResult(subdomain=subdomain, ip=None, is_alive=False, error=error)
+        if isinstance(a_answers, BaseException):
+            return DNSResult(subdomain=subdomain, ip=None, is_alive=False, error=str(a_answers))
+        
+        # CNAME is only diagnostic (CDN detection) - a miss is not an error
+        cname = None
+        if not isinstance(cname_answer, BaseException):
+            cname = cname_answer.cname
+        
+        return DNSResult(
+            subdomain=subdomain,
+            ip=a_answers[0].host,
+            is_alive=True,
+            cname=cname
+        )
+    
+    def resolve_bulk(self, subdomains: Collection[str], show_progress: bool = True) -> Dict[str, DNSResult]:
+        """Blocking wrapper around resolve_bulk_async() for CLI usage"""
+        return self._run(self.resolve_bulk_async(subdomains, show_progress))
+    
+    async def resolve_bulk_async(self, subdomains: Collection[str], show_progress: bool = True) -> Dict[str, DNSResult]:
         """
         Resolve multiple subdomains concurrently.
         
         Args:
-            subdomains: List of FQDNs to resolve
+            subdomains: FQDNs to resolve (any sized collection - no need to sort)
             show_progress: Show tqdm progress bar
             
         Returns:
@@ -113,6 +256,18 @@ class DNSResolver:
         
         results: Dict[str, DNSResult] = {}
         
+        # Concurrency is bounded inside resolve_single_async()
+        async def _bounded(subdomain: str) -> DNSResult:
+            try:
+                return await self.resolve_single_async(subdomain)
+            except Exception as e:
+                return DNSResult(
+                    subdomain=subdomain, 
+                    ip=None, 
+                    is_alive=False, 
+                    error=str(e)
+                )
+        
         # Progress bar setup
         pbar = tqdm(
             total=len(subdomains),
@@ -122,37 +277,25 @@ class DNSResolver:
             bar_format="{l_bar}{bar:40}{r_bar}{bar:-10b}"
         )
         
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all tasks
-            future_to_sub = {
-                executor.submit(self.resolve_single, sub): sub 
-                for sub in subdomains
-            }
-            
-            # Collect results as they complete
-            for future in as_completed(future_to_sub):
-                subdomain = future_to_sub[future]
-                try:
-                    result = future.result()
-                    results[subdomain] = result
-                except Exception as e:
-                    results[subdomain] = DNSResult(
-                        subdomain=subdomain, 
-                        ip=None, 
-                        is_alive=False, 
-                        error=str(e)
-                    )
-                pbar.update(1)
+        # Collect results as they complete
+        for coro in asyncio.as_completed([_bounded(sub) for sub in subdomains]):
+            result = await coro
+            results[result.subdomain] = result
+            pbar.update(1)
         
         pbar.close()
         
-        # Stats
+        self.report(results)
+        
+        return results
+    
+    @staticmethod
+    def report(results: Dict[str, DNSResult]):
+        """Print the alive/dead summary line"""
         alive = sum(1 for r in results.values() if r.is_alive)
         dead = len(results) - alive
         
         console.print(f"[green][+] DNS Resolution Complete: [bold]{alive}[/bold] alive, [dim]{dead} dead[/dim][/green]")
-        
-        return results
 
 
 if __name__ == "__main__":
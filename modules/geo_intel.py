@@ -5,17 +5,29 @@ Maps IP addresses to physical locations using ip-api.com
 Provides ISP, Organization, and GPS coordinates
 """
 
-import requests
+import aiohttp
+import asyncio
+import orjson
+import os
+import sqlite3
+import sys
 import time
 from typing import Dict, List, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from rich.console import Console
 from tqdm import tqdm
 
+from .http_session import get_session, close_session
+
 console = Console()
 
 
-@dataclass
+def _intern(value: Optional[str]) -> Optional[str]:
+    """sys.intern() that passes None (and other non-strings) through"""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+@dataclass(slots=True)
 class GeoData:
     """Geolocation intelligence data container"""
     ip: str
@@ -31,7 +43,76 @@ class GeoData:
     success: bool = False
     
     def to_dict(self) -> dict:
-        return asdict(self)
+        # Explicit literal - dataclasses.asdict() deep-copies every field
+        return {
+            'ip': self.ip,
+            'country': self.country,
+            'country_code': self.country_code,
+            'region': self.region,
+            'city': self.city,
+            'lat': self.lat,
+            'lon': self.lon,
+            'isp': self.isp,
+            'org': self.org,
+            'as_number': self.as_number,
+            'success': self.success,
+        }
+
+
+class _HeaderRateLimiter:
+    """
+    Request budget driven by ip-api.com's rate limit headers:
+    X-Rl (requests left in the current window) and X-Ttl (seconds
+    until the window resets). Until the first response arrives the
+    budget is unknown and only the caller's concurrency cap applies.
+    """
+    
+    def __init__(self):
+        self._remaining: Optional[int] = None
+        self._reset_at = 0.0
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """Wait for budget in the current window, then spend one request"""
+        async with self._lock:
+            if self._remaining is not None and self._remaining <= 0:
+                delay = self._reset_at - asyncio.get_running_loop().time()
+                if delay > 0:
+                    console.print(f"[dim][*] ip-api.com rate limit reached - waiting {delay:.0f}s[/dim]")
+                    await asyncio.sleep(delay)
+                # Fresh window - learn the new budget from the next response
+                self._remaining = None
+            
+            if self._remaining is not None:
+                self._remaining -= 1
+    
+    def spacing(self) -> float:
+        """Seconds between requests that spreads the remaining budget over the window"""
+        if self._remaining is None:
+            return 0.0
+        left = self._reset_at - asyncio.get_running_loop().time()
+        if left <= 0:
+            return 0.0
+        return left / max(self._remaining, 1)
+    
+    def update(self, headers):
+        """Record the budget reported by a response"""
+        try:
+            remaining = int(headers['X-Rl'])
+            ttl = int(headers['X-Ttl'])
+        except (KeyError, ValueError):
+            return
+        
+        now = asyncio.get_running_loop().time()
+        reset_at = now + ttl
+        
+        # New window (the old one passed, or the reset moved past X-Ttl's 1s
+        # rounding) - its count stands as is. Within one window responses can
+        # arrive out of order, so keep the more conservative count there.
+        rolled_over = now >= self._reset_at or reset_at > self._reset_at + 1
+        if self._remaining is None or rolled_over or remaining < self._remaining:
+            self._remaining = remaining
+        self._reset_at = reset_at
 
 
 class GeoIntelligence:
@@ -43,18 +124,126 @@ class GeoIntelligence:
     SINGLE_API = "http://ip-api.com/json/{ip}"
     BATCH_API = "http://ip-api.com/batch"
     
-    # ip-api.com free tier limits
+    # Only the keys _parse_entry reads (drops zip, timezone, region code)
+    FIELDS = "status,message,query,country,countryCode,regionName,city,lat,lon,isp,org,as"
+    
+    # ip-api.com free tier limits (request pacing comes from the X-Rl/X-Ttl headers)
     BATCH_SIZE = 100
-    RATE_LIMIT_DELAY = 1.5  # seconds between batches
+    BATCH_CONCURRENCY = 4  # batch POSTs in flight
+    MAX_ATTEMPTS = 2  # per batch, to ride out a 429
+    
+    # Persistent per-IP cache - IPs rarely move, and repeat runs hit the same CDNs
+    CACHE_PATH = os.path.expanduser('~/.cache/overseer/geo.sqlite')
+    CACHE_QUERY_CHUNK = 500  # IPs per SELECT ... IN (...) - stays under SQLite's variable limit
     
-    def __init__(self, timeout: int = 10):
+    def __init__(self,
+                 timeout: int = 10,
+                 session: Optional[aiohttp.ClientSession] = None,
+                 cache_ttl: int = 2592000):
+        """
+        Initialize geolocation engine.
+        
+        Args:
+            timeout: HTTP timeout in seconds
+            session: Shared HTTP session (default: the process-wide one)
+            cache_ttl: Seconds to trust a cached IP location (0 disables)
+        """
         self.timeout = timeout
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'OVERSEER-ReconTool/1.0'
-        })
+        self._timeout = aiohttp.ClientTimeout(total=timeout)
+        self._params = {'fields': self.FIELDS}
+        self._session = session
+        self.cache_ttl = cache_ttl
+        
+        # Batch concurrency cap + rate limiter, bound to the running event loop
+        self._limits_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._sem: Optional[asyncio.Semaphore] = None
+        self._limiter: Optional[_HeaderRateLimiter] = None
+        
+        self.cache: Optional[sqlite3.Connection] = None
+        if cache_ttl > 0:
+            try:
+                self.cache = self._open_cache(self.CACHE_PATH)
+            except (OSError, sqlite3.Error) as e:
+                console.print(f"[dim][Geo] Cache disabled: {e}[/dim]")
+    
+    @staticmethod
+    def _open_cache(path: str) -> sqlite3.Connection:
+        """Open (creating if needed) the SQLite geo cache"""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        conn = sqlite3.connect(path)
+        # WAL - concurrent runs can read while another one writes
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('CREATE TABLE IF NOT EXISTS geo (ip TEXT PRIMARY KEY, ts INTEGER, data TEXT)')
+        conn.commit()
+        return conn
+    
+    def _cache_get_many(self, ips: List[str]) -> Dict[str, GeoData]:
+        """Return fresh cached locations for any of ips, one indexed query per chunk"""
+        found: Dict[str, GeoData] = {}
+        if self.cache is None or not ips:
+            return found
+        
+        oldest = int(time.time()) - self.cache_ttl
+        for i in range(0, len(ips), self.CACHE_QUERY_CHUNK):
+            chunk = ips[i:i+self.CACHE_QUERY_CHUNK]
+            rows = self.cache.execute(
+                f"SELECT ip, data FROM geo WHERE ip IN ({','.join('?' * len(chunk))}) AND ts > ?",
+                (*chunk, oldest)
+            )
+            for ip, data in rows:
+                found[ip] = GeoData(**{key: _intern(value) for key, value in orjson.loads(data).items()})
+        return found
+    
+    def _cache_get(self, ip: str) -> Optional[GeoData]:
+        """Return a fresh cached location for ip, else None"""
+        return self._cache_get_many([ip]).get(ip)
+    
+    def _cache_put(self, results: List[GeoData]):
+        """Store successful lookups (failures are worth retrying next run)"""
+        if self.cache is None:
+            return
+        
+        now = int(time.time())
+        with self.cache:
+            self.cache.executemany(
+                'INSERT OR REPLACE INTO geo (ip, ts, data) VALUES (?, ?, ?)',
+                [(geo.ip, now, orjson.dumps(geo.to_dict()).decode()) for geo in results if geo.success]
+            )
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Injected session if usable, else the shared one"""
+        if self._session is not None and not self._session.closed:
+            return self._session
+        return await get_session()
+    
+    def _get_limits(self):
+        """Return the (semaphore, rate limiter) pair for the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._limits_loop is not loop:
+            self._limits_loop = loop
+            self._sem = asyncio.Semaphore(self.BATCH_CONCURRENCY)
+            self._limiter = _HeaderRateLimiter()
+        return self._sem, self._limiter
+    
+    def batch_spacing(self) -> float:
+        """Seconds to leave between optional (partial) batches under the current rate budget"""
+        return self._get_limits()[1].spacing()
+    
+    def _run(self, coro):
+        """Run a coroutine to completion from sync code, then clean up"""
+        async def _wrapped():
+            try:
+                return await coro
+            finally:
+                await close_session()
+        
+        return asyncio.run(_wrapped())
     
     def locate_single(self, ip: str) -> GeoData:
+        """Blocking wrapper around locate_single_async()"""
+        return self._run(self.locate_single_async(ip))
+    
+    async def locate_single_async(self, ip: str) -> GeoData:
         """
         Geolocate a single IP address.
         
@@ -64,36 +253,57 @@ class GeoIntelligence:
         Returns:
             GeoData with location intelligence
         """
+        cached = self._cache_get(ip)
+        if cached is not None:
+            return cached
+        
         try:
-            response = self.session.get(
+            session = await self._get_session()
+            async with session.get(
                 self.SINGLE_API.format(ip=ip),
-                timeout=self.timeout
-            )
-            response.raise_for_status()
-            data = response.json()
+                params=self._params,
+                timeout=self._timeout
+            ) as response:
+                response.raise_for_status()
+                data = orjson.loads(await response.read())
             
-            if data.get('status') == 'success':
-                return GeoData(
-                    ip=ip,
-                    country=data.get('country'),
-                    country_code=data.get('countryCode'),
-                    region=data.get('regionName'),
-                    city=data.get('city'),
-                    lat=data.get('lat'),
-                    lon=data.get('lon'),
-                    isp=data.get('isp'),
-                    org=data.get('org'),
-                    as_number=data.get('as'),
-                    success=True
-                )
-            else:
-                return GeoData(ip=ip, success=False)
+            geo = self._parse_entry(ip, data)
+            self._cache_put([geo])
+            return geo
                 
         except Exception as e:
             console.print(f"[yellow][!] Geo lookup failed for {ip}: {e}[/yellow]")
             return GeoData(ip=ip, success=False)
     
+    @staticmethod
+    def _parse_entry(ip: str, item: dict) -> GeoData:
+        """
+        Build GeoData from one ip-api.com response object.
+        Country/ISP/org strings repeat across most hosts of a target, so they
+        are interned - every record shares one object per distinct value.
+        """
+        if item.get('status') != 'success':
+            return GeoData(ip=ip, success=False)
+        
+        return GeoData(
+            ip=ip,
+            country=_intern(item.get('country')),
+            country_code=_intern(item.get('countryCode')),
+            region=_intern(item.get('regionName')),
+            city=_intern(item.get('city')),
+            lat=item.get('lat'),
+            lon=item.get('lon'),
+            isp=_intern(item.get('isp')),
+            org=_intern(item.get('org')),
+            as_number=_intern(item.get('as')),
+            success=True
+        )
+    
     def locate_batch(self, ips: List[str], show_progress: bool = True) -> Dict[str, GeoData]:
+        """Blocking wrapper around locate_batch_async() for CLI usage"""
+        return self._run(self.locate_batch_async(ips, show_progress))
+    
+    async def locate_batch_async(self, ips: List[str], show_progress: bool = True) -> Dict[str, GeoData]:
         """
         Batch geolocate multiple IP addresses.
         Uses ip-api.com batch endpoint for efficiency.
@@ -111,78 +321,106 @@ class GeoIntelligence:
         
         results: Dict[str, GeoData] = {}
         
+        # Serve what we can from the persistent cache
+        results.update(self._cache_get_many(unique_ips))
+        to_fetch = [ip for ip in unique_ips if ip not in results]
+        
+        if results:
+            console.print(f"[dim][Geo] {len(results)} IPs served from cache[/dim]")
+        
         # Split into batches
-        batches = [unique_ips[i:i+self.BATCH_SIZE] for i in range(0, len(unique_ips), self.BATCH_SIZE)]
+        batches = [to_fetch[i:i+self.BATCH_SIZE] for i in range(0, len(to_fetch), self.BATCH_SIZE)]
         
         pbar = tqdm(
-            total=len(unique_ips),
+            total=len(to_fetch),
             desc="Geolocation",
             unit="IPs",
             disable=not show_progress,
             bar_format="{l_bar}{bar:40}{r_bar}{bar:-10b}"
         )
         
-        for batch_idx, batch in enumerate(batches):
+        async def _do_batch(batch: List[str]):
+            for geo in await self._post_batch(batch):
+                results[geo.ip] = geo
+                pbar.update(1)
+        
+        await asyncio.gather(*(_do_batch(batch) for batch in batches))
+        
+        pbar.close()
+        
+        self.report(results)
+        
+        return results
+    
+    async def locate_chunk_async(self, ips: List[str]) -> List[GeoData]:
+        """
+        Geolocate up to BATCH_SIZE IPs with a single request, cache first.
+        Quiet building block for streaming callers (see modules.pipeline).
+        
+        Args:
+            ips: Unique IPv4 addresses, at most BATCH_SIZE
+            
+        Returns:
+            GeoData for every IP
+        """
+        cached = self._cache_get_many(ips)
+        located = list(cached.values())
+        misses = [ip for ip in ips if ip not in cached]
+        
+        if misses:
+            located.extend(await self._post_batch(misses))
+        return located
+    
+    async def _post_batch(self, batch: List[str]) -> List[GeoData]:
+        """POST one batch to ip-api.com under the shared concurrency cap and rate limit"""
+        payload = [{"query": ip} for ip in batch]
+        session = await self._get_session()
+        sem, limiter = self._get_limits()
+        
+        async with sem:
             try:
-                # Prepare batch request
-                payload = [{"query": ip} for ip in batch]
-                
-                response = self.session.post(
-                    self.BATCH_API,
-                    json=payload,
-                    timeout=self.timeout
-                )
-                response.raise_for_status()
-                data = response.json()
-                
-                # Process batch results
-                for item in data:
-                    ip = item.get('query', '')
-                    
-                    if item.get('status') == 'success':
-                        results[ip] = GeoData(
-                            ip=ip,
-                            country=item.get('country'),
-                            country_code=item.get('countryCode'),
-                            region=item.get('regionName'),
-                            city=item.get('city'),
-                            lat=item.get('lat'),
-                            lon=item.get('lon'),
-                            isp=item.get('isp'),
-                            org=item.get('org'),
-                            as_number=item.get('as'),
-                            success=True
-                        )
-                    else:
-                        results[ip] = GeoData(ip=ip, success=False)
+                for _ in range(self.MAX_ATTEMPTS):
+                    await limiter.acquire()
                     
-                    pbar.update(1)
+                    async with session.post(
+                        self.BATCH_API,
+                        params=self._params,
+                        json=payload,
+                        timeout=self._timeout
+                    ) as response:
+                        limiter.update(response.headers)
+                        if response.status == 429:
+                            continue
+                        response.raise_for_status()
+                        data = orjson.loads(await response.read())
+                    break
+                else:
+                    raise RuntimeError("rate limited by ip-api.com")
+                
+                located = [self._parse_entry(item.get('query', ''), item) for item in data]
+                self._cache_put(located)
                 
-                # Rate limiting between batches
-                if batch_idx < len(batches) - 1:
-                    time.sleep(self.RATE_LIMIT_DELAY)
-                    
             except Exception as e:
                 console.print(f"[yellow][!] Batch geo lookup failed: {e}[/yellow]")
                 # Mark failed batch
-                for ip in batch:
-                    if ip not in results:
-                        results[ip] = GeoData(ip=ip, success=False)
-                    pbar.update(1)
+                return [GeoData(ip=ip, success=False) for ip in batch]
         
-        pbar.close()
-        
-        # Stats
+        # ip-api answers in request order, but never trust a short reply
+        missing = set(batch).difference(geo.ip for geo in located)
+        located.extend(GeoData(ip=ip, success=False) for ip in missing)
+        return located
+    
+    @staticmethod
+    def report(results: Dict[str, GeoData]):
+        """Print the geolocation summary line"""
         success_count = sum(1 for r in results.values() if r.success)
         countries = set(r.country for r in results.values() if r.country)
         
         console.print(f"[green][+] Geolocation Complete: [bold]{success_count}[/bold] located across [bold]{len(countries)}[/bold] countries[/green]")
-        
-        return results
 
 
 if __name__ == "__main__":
-    # Module test
+    # Module test (run as: python -m modules.geo_intel)
     geo = GeoIntelligence()
     test_ips = ['8.8.8.8', '1.1.1.1', '151.101.1.140']
     results = geo.locate_batch(test_ips)
@@ -0,0 +1,53 @@
+"""
+PROJECT OVERSEER - Shared HTTP Session
+========================================
+One long-lived aiohttp session shared by every module
+Single connection pool, DNS cache and TLS session reuse per run
+"""
+
+import aiohttp
+import asyncio
+import orjson
+from typing import Optional
+
+# Connection pool sizing - bounded per host so no single API gets hammered
+POOL_LIMIT = 200
+POOL_LIMIT_PER_HOST = 64
+DNS_CACHE_TTL = 300  # seconds
+KEEPALIVE_TIMEOUT = 75  # seconds - outlives ip-api.com's 60s rate-limit window
+
+# Sent on every request - some CT sources throttle non-browser clients
+USER_AGENT = 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+_session: Optional[aiohttp.ClientSession] = None
+_lock = asyncio.Lock()
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """Return the process-wide HTTP session, creating it on first use"""
+    global _session
+    
+    async with _lock:
+        if _session is None or _session.closed:
+            _session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=POOL_LIMIT,
+                    limit_per_host=POOL_LIMIT_PER_HOST,
+                    ttl_dns_cache=DNS_CACHE_TTL,
+                    keepalive_timeout=KEEPALIVE_TIMEOUT
+                ),
+                headers={'User-Agent': USER_AGENT},
+                # json= request bodies (ip-api batches) encoded by orjson
+                json_serialize=lambda obj: orjson.dumps(obj).decode()
+            )
+    
+    return _session
+
+
+async def close_session():
+    """Close the shared session (call before the event loop shuts down)"""
+    global _session
+    
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
@@ -5,17 +5,148 @@ Generates interactive attack surface maps using Folium
 Visualizes infrastructure spread across the globe
 """
 
+import bisect
 import folium
-from folium.plugins import MarkerCluster, Fullscreen, MiniMap
+import functools
+import ipaddress
+import string
+from folium.plugins import FastMarkerCluster, Fullscreen, MiniMap
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 from rich.console import Console
+from html import escape
+from statistics import fmean
 import os
 
 console = Console()
 
+# Color coding by infrastructure type - THREAT PRIORITIZATION
+# (keywords, color) in priority order - first match wins
+_COLOR_RULES = (
+    # GREEN - Major Cloud Providers (Usually secure, WAF protected)
+    (('amazon', 'aws', 'ec2', 'amazonaws'), 'green'),                          # AWS - Secure
+    (('google', 'gcp', 'cloud platform'), 'green'),                            # Google Cloud - Secure
+    (('microsoft', 'azure'), 'green'),                                         # Azure - Secure
+    
+    # ORANGE - CDN/Edge Providers (Traffic proxied, limited attack surface)
+    (('cloudflare', 'akamai', 'fastly', 'cdn', 'edgecast', 'incapsula'), 'orange'),  # CDN - Proxied
+    
+    # BLUE - Known VPS Providers (Monitored but potentially misconfigured)
+    (('digitalocean', 'linode', 'vultr', 'ovh', 'hetzner', 'contabo'), 'blue'),  # VPS - Known provider
+    
+    # RED - HIGH PRIORITY TARGETS
+    # Residential/Commercial ISPs (likely on-premise or forgotten servers)
+    (('vivo', 'claro', 'tim', 'oi ', 'net virtua', 'gvt'), 'red'),             # Brazilian ISP - On-premise!
+    (('comcast', 'verizon', 'at&t', 'spectrum', 'cox'), 'red'),                # US ISP - On-premise!
+)
+
+# Published provider ranges - an IP inside one of these is classified by who
+# actually announces it, not by what its whois org string happens to contain.
+# Embedded (no startup download); org/isp keywords remain the fallback.
+_PROVIDER_CIDRS = (
+    # GREEN - AWS (major EC2/CloudFront/Global Accelerator aggregates of ip-ranges.json)
+    (('3.0.0.0/8', '13.32.0.0/15', '13.224.0.0/14', '13.248.0.0/14', '15.177.0.0/16',
+      '15.197.0.0/16', '18.128.0.0/9', '34.192.0.0/10', '35.152.0.0/13', '35.160.0.0/12',
+      '35.176.0.0/13', '44.192.0.0/10', '50.16.0.0/15', '50.112.0.0/16', '52.0.0.0/11',
+      '52.32.0.0/11', '52.64.0.0/12', '52.84.0.0/15', '54.64.0.0/10', '54.144.0.0/12',
+      '54.160.0.0/11', '54.192.0.0/10', '99.77.0.0/16', '99.80.0.0/12'), 'green'),
+    
+    # GREEN - Google Cloud (major aggregates of cloud.json)
+    (('34.64.0.0/10', '34.128.0.0/10', '35.184.0.0/13', '35.192.0.0/12', '35.208.0.0/12',
+      '35.224.0.0/12', '35.240.0.0/13', '104.154.0.0/15', '104.196.0.0/14', '107.167.160.0/19',
+      '107.178.192.0/18', '130.211.0.0/16', '146.148.0.0/17'), 'green'),
+    
+    # GREEN - Azure (major aggregates of the public-cloud service tags)
+    (('13.64.0.0/11', '13.104.0.0/14', '20.36.0.0/14', '20.40.0.0/13', '20.48.0.0/12',
+      '20.64.0.0/10', '20.192.0.0/10', '40.64.0.0/10', '52.160.0.0/11', '52.224.0.0/11',
+      '104.40.0.0/13', '104.208.0.0/13', '137.116.0.0/15', '138.91.0.0/16', '168.61.0.0/16',
+      '168.62.0.0/15', '191.232.0.0/13'), 'green'),
+    
+    # ORANGE - Cloudflare (https://www.cloudflare.com/ips-v4)
+    (('173.245.48.0/20', '103.21.244.0/22', '103.22.200.0/22', '103.31.4.0/22',
+      '141.101.64.0/18', '108.162.192.0/18', '190.93.240.0/20', '188.114.96.0/20',
+      '197.234.240.0/22', '198.41.128.0/17', '162.158.0.0/15', '104.16.0.0/13',
+      '104.24.0.0/14', '172.64.0.0/13', '131.0.72.0/22'), 'orange'),
+    
+    # ORANGE - Fastly (https://api.fastly.com/public-ip-list)
+    (('23.235.32.0/20', '43.249.72.0/22', '103.244.50.0/24', '103.245.222.0/23',
+      '103.245.224.0/24', '104.156.80.0/20', '140.248.64.0/18', '140.248.128.0/17',
+      '146.75.0.0/17', '151.101.0.0/16', '157.52.64.0/18', '167.82.0.0/17',
+      '167.82.128.0/20', '167.82.160.0/20', '167.82.224.0/20', '172.111.64.0/18',
+      '185.31.16.0/22', '199.27.72.0/21', '199.232.0.0/16'), 'orange'),
+)
+
+
+def _build_cidr_table(rules):
+    """Flatten CIDR rules into parallel sorted (starts, ends, colors) lists for bisect"""
+    ranges = sorted(
+        (int(net.network_address), int(net.broadcast_address), color)
+        for cidrs, color in rules
+        for net in map(ipaddress.IPv4Network, cidrs)
+    )
+    return (
+        [start for start, _, _ in ranges],
+        [end for _, end, _ in ranges],
+        [color for _, _, color in ranges],
+    )
+
+
+_CIDR_STARTS, _CIDR_ENDS, _CIDR_COLORS = _build_cidr_table(_PROVIDER_CIDRS)
+
+# Marker popup - parsed once at import, filled per node
+_POPUP_TMPL = string.Template("""
+<div style="font-family: 'Courier New', monospace; font-size: 12px; min-width: 250px;">
+    <b style="color: #ff6b6b;">TARGET INTEL</b><br>
+    <hr style="border-color: #333;">
+    <b>Subdomain:</b> $subdomain<br>
+    <b>IP Address:</b> $ip<br>
+    <b>Location:</b> $city, $country<br>
+    <b>ISP:</b> $isp<br>
+    <b>Organization:</b> $org<br>
+</div>
+""")
+
+
+def _cidr_color(ip: Optional[str]) -> Optional[str]:
+    """Color of the provider range containing ip, or None"""
+    try:
+        addr = int(ipaddress.IPv4Address(ip))
+    except ValueError:
+        return None
+    
+    # Ranges don't overlap - only the closest start at or below addr can match
+    i = bisect.bisect_right(_CIDR_STARTS, addr) - 1
+    if i >= 0 and addr <= _CIDR_ENDS[i]:
+        return _CIDR_COLORS[i]
+    return None
+
+
+@functools.lru_cache(maxsize=4096)
+def _keyword_color(org: str, isp: str) -> str:
+    """Fallback classification on org/isp keywords (memoized - large targets repeat the same few strings)"""
+    org_lower = (org or '').lower() + (isp or '').lower()
+    
+    for keywords, color in _COLOR_RULES:
+        if any(keyword in org_lower for keyword in keywords):
+            return color
+    
+    # RED - Unknown organization (HIGHEST PRIORITY - potential Shadow IT)
+    return 'red'  # Unknown - INVESTIGATE!
+
+
+def get_marker_color(org: str, isp: str, ip: Optional[str] = None) -> str:
+    """
+    Color code markers by infrastructure type and threat priority.
+    Known provider ranges win; org/isp keywords are the fallback.
+    
+    GREEN: Secure cloud providers (likely have WAF, hardened)
+    ORANGE: CDN/Edge providers (cached, not direct access)
+    RED: HIGH PRIORITY - Unknown/On-premise/VPS (potential Shadow IT)
+    """
+    return _cidr_color(ip) or _keyword_color(org, isp)
 
-@dataclass
+
+@dataclass(slots=True)
 class MapPoint:
     """Data point for map visualization"""
     subdomain: str
@@ -38,6 +169,20 @@ class TacticalMapGenerator:
     DARK_TILES = "CartoDB dark_matter"
     LIGHT_TILES = "CartoDB positron"
     
+    # Client-side marker factory for FastMarkerCluster rows:
+    # [lat, lon, popup_html, marker_color, tooltip]
+    MARKER_CALLBACK = """
+    function (row) {
+        var icon = L.AwesomeMarkers.icon({
+            markerColor: row[3], iconColor: 'white', icon: 'server', prefix: 'fa'
+        });
+        var marker = L.marker(new L.LatLng(row[0], row[1]), {icon: icon});
+        marker.bindPopup(row[2], {maxWidth: 400});
+        marker.bindTooltip(row[4]);
+        return marker;
+    }
+    """
+    
     def __init__(self, theme: str = "dark"):
         """
         Initialize map generator.
@@ -69,8 +214,8 @@ class TacticalMapGenerator:
             return ""
         
         # Calculate map center (average of all points)
-        avg_lat = sum(p.lat for p in points) / len(points)
-        avg_lon = sum(p.lon for p in points) / len(points)
+        avg_lat = fmean([p.lat for p in points])
+        avg_lon = fmean([p.lon for p in points])
         
         # Create base map
         attack_map = folium.Map(
@@ -86,8 +231,28 @@ class TacticalMapGenerator:
         # Add mini map for context
         MiniMap(toggle_display=True, tile_layer=self.tiles).add_to(attack_map)
         
-        # Create marker cluster for performance
-        marker_cluster = MarkerCluster(
+        # Build one plain row per node - markers are created in the browser by
+        # a single JS callback instead of a Python object + JS snippet each
+        rows = []
+        for point in points:
+            color = get_marker_color(point.org, point.isp, point.ip)
+            
+            # Create popup with Intel (ip-api strings are third-party data - escape them)
+            popup_html = _POPUP_TMPL.substitute(
+                subdomain=point.subdomain,
+                ip=point.ip,
+                city=escape(point.city),
+                country=escape(point.country),
+                isp=escape(point.isp),
+                org=escape(point.org)
+            )
+            
+            rows.append([point.lat, point.lon, popup_html, color, f"{point.subdomain} ({point.ip})"])
+        
+        # Clustered markers for performance
+        FastMarkerCluster(
+            rows,
+            callback=self.MARKER_CALLBACK,
             name="Infrastructure Nodes",
             overlay=True,
             control=True,
@@ -99,71 +264,6 @@ class TacticalMapGenerator:
             }
         ).add_to(attack_map)
         
-        # Color coding by infrastructure type - THREAT PRIORITIZATION
-        def get_marker_color(org: str, isp: str) -> str:
-            """
-            Color code markers by infrastructure type and threat priority.
-            
-            GREEN: Secure cloud providers (likely have WAF, hardened)
-            ORANGE: CDN/Edge providers (cached, not direct access)
-            RED: HIGH PRIORITY - Unknown/On-premise/VPS (potential Shadow IT)
-            """
-            org_lower = (org or '').lower() + (isp or '').lower()
-            
-            # GREEN - Major Cloud Providers (Usually secure, WAF protected)
-            if any(cloud in org_lower for cloud in ['amazon', 'aws', 'ec2', 'amazonaws']):
-                return 'green'  # AWS - Secure
-            elif any(cloud in org_lower for cloud in ['google', 'gcp', 'cloud platform']):
-                return 'green'  # Google Cloud - Secure
-            elif any(cloud in org_lower for cloud in ['microsoft', 'azure']):
-                return 'green'  # Azure - Secure
-            
-            # ORANGE - CDN/Edge Providers (Traffic proxied, limited attack surface)
-            elif any(cdn in org_lower for cdn in ['cloudflare', 'akamai', 'fastly', 'cdn', 'edgecast', 'incapsula']):
-                return 'orange'  # CDN - Proxied
-            
-            # BLUE - Known VPS Providers (Monitored but potentially misconfigured)
-            elif any(vps in org_lower for vps in ['digitalocean', 'linode', 'vultr', 'ovh', 'hetzner', 'contabo']):
-                return 'blue'  # VPS - Known provider
-            
-            # RED - HIGH PRIORITY TARGETS
-            # Residential/Commercial ISPs (likely on-premise or forgotten servers)
-            elif any(isp_br in org_lower for isp_br in ['vivo', 'claro', 'tim', 'oi ', 'net virtua', 'gvt']):
-                return 'red'  # Brazilian ISP - On-premise!
-            elif any(isp_us in org_lower for isp_us in ['comcast', 'verizon', 'at&t', 'spectrum', 'cox']):
-                return 'red'  # US ISP - On-premise!
-            
-            # RED - Unknown organization (HIGHEST PRIORITY - potential Shadow IT)
-            else:
-                return 'red'  # Unknown - INVESTIGATE!
-        
-        # Add markers
-        for point in points:
-            color = get_marker_color(point.org, point.isp)
-            
-            # Create popup with Intel
-            popup_html = f"""
-            <div style="font-family: 'Courier New', monospace; font-size: 12px; min-width: 250px;">
-                <b style="color: #ff6b6b;">TARGET INTEL</b><br>
-                <hr style="border-color: #333;">
-                <b>Subdomain:</b> {point.subdomain}<br>
-                <b>IP Address:</b> {point.ip}<br>
-                <b>Location:</b> {point.city}, {point.country}<br>
-                <b>ISP:</b> {point.isp}<br>
-                <b>Organization:</b> {point.org}<br>
-            </div>
-            """
-            
-            popup = folium.Popup(popup_html, max_width=400)
-            
-            # Create marker with icon
-            folium.Marker(
-                location=[point.lat, point.lon],
-                popup=popup,
-                tooltip=f"{point.subdomain} ({point.ip})",
-                icon=folium.Icon(color=color, icon='server', prefix='fa')
-            ).add_to(marker_cluster)
-        
         # Add legend - THREAT PRIORITY
         legend_html = """
         <div style="position: fixed; bottom: 50px; right: 50px; z-index: 1000; 
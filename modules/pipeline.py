@@ -0,0 +1,187 @@
+"""
+PROJECT OVERSEER - Recon Pipeline
+==================================
+Streams CT Log enumeration -> DNS resolution -> Geolocation
+through asyncio queues so every stage starts on the first records
+of the previous one instead of waiting for it to finish
+"""
+
+import asyncio
+from typing import Dict, List, Optional, Set
+from dataclasses import dataclass, field
+from rich.console import Console
+from tqdm import tqdm
+
+from .ct_enum import CTLogEnumerator
+from .dns_resolver import DNSResolver, DNSResult
+from .geo_intel import GeoIntelligence, GeoData
+
+console = Console()
+
+
+@dataclass(slots=True)
+class PipelineResult:
+    """Everything collected by one pipeline run"""
+    subdomains: Set[str] = field(default_factory=set)
+    dns_results: Dict[str, DNSResult] = field(default_factory=dict)
+    alive_hosts: Dict[str, DNSResult] = field(default_factory=dict)
+    unique_ips: Set[str] = field(default_factory=set)
+    geo_results: Dict[str, GeoData] = field(default_factory=dict)
+
+
+class ReconPipeline:
+    """
+    Producer/consumer pipeline over the three recon stages:
+        
+        CT sources --sub_q--> K DNS workers --ip_q--> geo worker
+    
+    End of stream is signalled with None sentinels, one per consumer.
+    Wall clock approaches the slowest stage instead of the sum of all three.
+    """
+    
+    # Minimum seconds a partial geo batch waits for more IPs before it is sent
+    # (partials are further spaced by ip-api's remaining rate budget)
+    GEO_FLUSH_DELAY = 1.0
+    
+    def __init__(self,
+                 ct_enum: CTLogEnumerator,
+                 dns_resolver: DNSResolver,
+                 geo_intel: GeoIntelligence,
+                 show_progress: bool = True):
+        """
+        Initialize pipeline.
+        
+        Args:
+            ct_enum: Subdomain source
+            dns_resolver: Resolver (its max_workers sets the DNS worker count)
+            geo_intel: Geolocation engine
+            show_progress: Show tqdm progress bar for DNS
+        """
+        self.ct_enum = ct_enum
+        self.dns_resolver = dns_resolver
+        self.geo_intel = geo_intel
+        self.show_progress = show_progress
+    
+    async def run(self, target: str) -> PipelineResult:
+        """
+        Enumerate, resolve and geolocate target's attack surface.
+        
+        Args:
+            target: Target domain (e.g., 'tesla.com')
+        
+        Returns:
+            PipelineResult (empty if CT Logs yielded nothing)
+        """
+        result = PipelineResult()
+        sub_q: asyncio.Queue = asyncio.Queue()
+        ip_q: asyncio.Queue = asyncio.Queue()
+        n_workers = max(1, self.dns_resolver.max_workers)
+        
+        pbar = tqdm(
+            total=0,
+            desc="DNS Resolution",
+            unit="hosts",
+            disable=not self.show_progress,
+            bar_format="{l_bar}{bar:40}{r_bar}{bar:-10b}"
+        )
+        
+        def _enqueue(subdomain: str):
+            result.subdomains.add(subdomain)
+            sub_q.put_nowait(subdomain)
+            # No refresh() - a redraw per name floods the terminal when a source
+            # hands over thousands at once; update() repaints at tqdm's own rate
+            pbar.total += 1
+        
+        async def producer():
+            try:
+                async for subdomain in self.ct_enum.iter_subdomains(target):
+                    _enqueue(subdomain)
+                
+                # The base domain is only worth resolving alongside real findings
+                if result.subdomains and target not in result.subdomains:
+                    _enqueue(target)
+            finally:
+                for _ in range(n_workers):
+                    sub_q.put_nowait(None)
+        
+        async def dns_worker():
+            while (subdomain := await sub_q.get()) is not None:
+                try:
+                    dns = await self.dns_resolver.resolve_single_async(subdomain)
+                except Exception as e:
+                    dns = DNSResult(subdomain=subdomain, ip=None, is_alive=False, error=str(e))
+                
+                result.dns_results[subdomain] = dns
+                pbar.update(1)
+                
+                # Live-host filter and IP dedup in the same pass that resolves
+                if dns.is_alive and dns.ip:
+                    result.alive_hosts[subdomain] = dns
+                    if dns.ip not in result.unique_ips:
+                        result.unique_ips.add(dns.ip)
+                        ip_q.put_nowait(dns.ip)
+        
+        async def geo_worker():
+            pending: List[str] = []
+            in_flight: List[asyncio.Task] = []
+            flush_timer: Optional[asyncio.TimerHandle] = None
+            loop = asyncio.get_running_loop()
+            last_sent = float('-inf')
+            
+            def _send():
+                nonlocal flush_timer, last_sent
+                if flush_timer is not None:
+                    flush_timer.cancel()
+                    flush_timer = None
+                if pending:
+                    in_flight.append(asyncio.ensure_future(self.geo_intel.locate_chunk_async(pending[:])))
+                    pending.clear()
+                    last_sent = loop.time()
+            
+            def _partial_due():
+                nonlocal flush_timer
+                flush_timer = None
+                if not pending:
+                    return
+                
+                # A partial batch costs a full request of ip-api's budget - only
+                # send one when nothing is in flight and the rate window allows it
+                wait = last_sent + self.geo_intel.batch_spacing() - loop.time()
+                busy = any(not task.done() for task in in_flight)
+                if busy or wait > 0:
+                    flush_timer = loop.call_later(max(wait, self.GEO_FLUSH_DELAY), _partial_due)
+                else:
+                    _send()
+            
+            # Full batches go out at once; a partial one once it has waited
+            # GEO_FLUSH_DELAY and the budget allows, so small targets don't wait
+            # for DNS to finish before geolocating
+            while (ip := await ip_q.get()) is not None:
+                pending.append(ip)
+                if len(pending) >= self.geo_intel.BATCH_SIZE:
+                    _send()
+                elif flush_timer is None:
+                    flush_timer = loop.call_later(self.GEO_FLUSH_DELAY, _partial_due)
+            _send()
+            
+            for located in await asyncio.gather(*in_flight):
+                for geo in located:
+                    result.geo_results[geo.ip] = geo
+        
+        async def dns_stage():
+            try:
+                await asyncio.gather(*(dns_worker() for _ in range(n_workers)))
+            finally:
+                ip_q.put_nowait(None)
+        
+        try:
+            await asyncio.gather(producer(), dns_stage(), geo_worker())
+        finally:
+            pbar.close()
+        
+        if result.dns_results:
+            self.dns_resolver.report(result.dns_results)
+        if result.geo_results:
+            self.geo_intel.report(result.geo_results)
+        
+        return result
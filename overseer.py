@@ -27,28 +27,32 @@ License: For authorized security testing only
 """
 
 import argparse
+import asyncio
+import csv
+import heapq
+import re
 import sys
-import pandas as pd
 from datetime import datetime
 from pathlib import Path
+from collections import Counter
+from itertools import islice
 from typing import List, Optional
 
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from modules.ct_enum import CTLogEnumerator
-from modules.dns_resolver import DNSResolver, DNSResult
-from modules.geo_intel import GeoIntelligence, GeoData
-from modules.map_generator import TacticalMapGenerator, MapPoint
+# Recon modules (aiohttp, aiodns, folium, ...) are imported where they are
+# used, so --help and argument errors don't pay for loading them
 
 console = Console()
 
+# Subdomain keywords that hint at Shadow IT - compiled once at import.
+# Plain substrings (no word boundaries): 'dev1' and 'apigw' count too.
+_INTERESTING = re.compile(r'dev|test|stage|admin|internal|vpn|api|beta|old|legacy', re.IGNORECASE)
 
-def print_banner():
-    """Display the OVERSEER banner"""
-    banner = """
+# Startup banner (rich markup) - built once at import
+_BANNER = """
 [bold green]
     ██████╗ ██╗   ██╗███████╗██████╗ ███████╗███████╗███████╗██████╗ 
    ██╔═══██╗██║   ██║██╔════╝██╔══██╗██╔════╝██╔════╝██╔════╝██╔══██╗
@@ -61,7 +65,24 @@ def print_banner():
 [dim cyan]        ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━[/dim cyan]
 [yellow]        [!] Passive Reconnaissance | 100% Legal OSINT[/yellow]
     """
-    console.print(banner)
+
+
+def print_banner():
+    """Display the OVERSEER banner"""
+    console.print(_BANNER)
+
+
+def _threads_arg(value: str) -> Optional[int]:
+    """--threads value: a positive int, or 'auto' (None) for adaptive concurrency"""
+    if value.lower() == 'auto':
+        return None
+    try:
+        threads = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected a number or 'auto', got {value!r}")
+    if threads < 1:
+        raise argparse.ArgumentTypeError("must be at least 1")
+    return threads
 
 
 def parse_arguments() -> argparse.Namespace:
@@ -97,9 +118,10 @@ Examples:
     
     parser.add_argument(
         '--threads',
-        type=int,
-        default=50,
-        help='Number of concurrent DNS resolution threads (default: 50)'
+        type=_threads_arg,
+        default=None,
+        metavar='N|auto',
+        help='Concurrent DNS queries, or "auto" to adapt to timeouts (default: auto)'
     )
     
     parser.add_argument(
@@ -125,76 +147,90 @@ Examples:
     return parser.parse_args()
 
 
-def run_reconnaissance(args: argparse.Namespace) -> Optional[pd.DataFrame]:
+async def collect_intel(target: str, args: argparse.Namespace):
     """
-    Execute the full reconnaissance pipeline.
+    Run the network-bound phases (CT, DNS, Geo) on one event loop.
+    The phases are streamed through ReconPipeline, so DNS starts on the
+    first CT results and geolocation on the first live IPs.
+    All HTTP traffic goes through a single shared session.
     
     Returns:
-        DataFrame with all collected intelligence
+        (alive_hosts, geo_results) tuple, or None if a phase came up empty
     """
-    target = args.target.lower().strip()
+    from modules.ct_enum import CTLogEnumerator
+    from modules.dns_resolver import DNSResolver
+    from modules.geo_intel import GeoIntelligence
+    from modules.http_session import get_session, close_session
+    from modules.pipeline import ReconPipeline
     
-    console.print(Panel(
-        f"[bold white]Target Acquired:[/bold white] [cyan]{target}[/cyan]\n"
-        f"[dim]Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}[/dim]",
-        title="[bold red]MISSION BRIEFING[/bold red]",
-        border_style="red"
-    ))
+    session = await get_session()
     
     # ═══════════════════════════════════════════════════════════════════
-    # PHASE 1: Certificate Transparency Enumeration
+    # PHASES 1-3: CT Enumeration -> DNS Resolution -> Geolocation
     # ═══════════════════════════════════════════════════════════════════
-    console.print("\n[bold magenta]═══ PHASE 1: CT LOG ENUMERATION ═══[/bold magenta]\n")
+    console.print("\n[bold magenta]═══ PHASES 1-3: CT LOGS → DNS → GEOLOCATION ═══[/bold magenta]\n")
+    
+    dns_resolver = DNSResolver(
+        timeout=args.timeout,
+        max_workers=args.threads
+    )
+    pipeline = ReconPipeline(
+        CTLogEnumerator(timeout=30, session=session),
+        dns_resolver,
+        GeoIntelligence(timeout=10, session=session)
+    )
     
-    ct_enum = CTLogEnumerator(timeout=30)
-    subdomains = ct_enum.enumerate(target)
+    try:
+        result = await pipeline.run(target)
+    finally:
+        await dns_resolver.close()
+        await close_session()
     
-    if not subdomains:
+    if not result.subdomains:
         console.print("[red][!] No subdomains found. Target may have limited CT log presence.[/red]")
         return None
     
-    # Add base domain to list
-    subdomains.add(target)
-    subdomain_list = sorted(list(subdomains))
+    if not result.alive_hosts:
+        console.print("[red][!] No live hosts found. All subdomains appear to be defunct.[/red]")
+        return None
     
-    # ═══════════════════════════════════════════════════════════════════
-    # PHASE 2: DNS Resolution
-    # ═══════════════════════════════════════════════════════════════════
-    console.print("\n[bold magenta]═══ PHASE 2: DNS RESOLUTION ═══[/bold magenta]\n")
+    return result.alive_hosts, result.geo_results
+
+
+def run_reconnaissance(args: argparse.Namespace) -> Optional[List[dict]]:
+    """
+    Execute the full reconnaissance pipeline.
     
-    dns_resolver = DNSResolver(
-        timeout=args.timeout,
-        max_workers=args.threads
-    )
-    dns_results = dns_resolver.resolve_bulk(subdomain_list)
+    Returns:
+        List of per-subdomain intel records
+    """
+    target = args.target.lower().strip()
     
-    # Filter alive hosts
-    alive_hosts = {
-        sub: result for sub, result in dns_results.items() 
-        if result.is_alive and result.ip
-    }
+    console.print(Panel(
+        f"[bold white]Target Acquired:[/bold white] [cyan]{target}[/cyan]\n"
+        f"[dim]Timestamp: {datetime.now().isoformat(sep=' ', timespec='seconds')}[/dim]",
+        title="[bold red]MISSION BRIEFING[/bold red]",
+        border_style="red"
+    ))
     
-    if not alive_hosts:
-        console.print("[red][!] No live hosts found. All subdomains appear to be defunct.[/red]")
+    intel = asyncio.run(collect_intel(target, args))
+    if intel is None:
         return None
     
-    # ═══════════════════════════════════════════════════════════════════
-    # PHASE 3: Geolocation Intelligence
-    # ═══════════════════════════════════════════════════════════════════
-    console.print("\n[bold magenta]═══ PHASE 3: GEOLOCATION INTEL ═══[/bold magenta]\n")
+    alive_hosts, geo_results = intel
     
-    geo_intel = GeoIntelligence(timeout=10)
-    unique_ips = list(set(result.ip for result in alive_hosts.values()))
-    geo_results = geo_intel.locate_batch(unique_ips)
+    from modules.geo_intel import GeoData
     
     # ═══════════════════════════════════════════════════════════════════
     # PHASE 4: Data Aggregation
     # ═══════════════════════════════════════════════════════════════════
     console.print("\n[bold magenta]═══ PHASE 4: INTEL AGGREGATION ═══[/bold magenta]\n")
     
-    # Build comprehensive dataset
+    # Build comprehensive dataset - sorted here, once, for stable output
+    # (only live hosts, and nothing upstream depends on order)
     records = []
-    for subdomain, dns_result in alive_hosts.items():
+    for subdomain in sorted(alive_hosts):
+        dns_result = alive_hosts[subdomain]
         ip = dns_result.ip
         geo = geo_results.get(ip, GeoData(ip=ip, success=False))
         
@@ -214,55 +250,72 @@ def run_reconnaissance(args: argparse.Namespace) -> Optional[pd.DataFrame]:
             'geo_success': geo.success
         })
     
-    df = pd.DataFrame(records)
-    
     # ═══════════════════════════════════════════════════════════════════
     # PHASE 5: Visualization & Output
     # ═══════════════════════════════════════════════════════════════════
     console.print("\n[bold magenta]═══ PHASE 5: TACTICAL OUTPUT ═══[/bold magenta]\n")
     
     # Print summary statistics
-    print_summary(df, target)
+    print_summary(records, target)
     
     # Generate map if not disabled
     if not args.no_map:
-        # Prepare map points (only those with valid coordinates)
-        map_points = []
-        for _, row in df.iterrows():
-            if pd.notna(row['lat']) and pd.notna(row['lon']):
-                map_points.append(MapPoint(
-                    subdomain=row['subdomain'],
-                    ip=row['ip'],
-                    lat=row['lat'],
-                    lon=row['lon'],
-                    country=row['country'] or 'Unknown',
-                    city=row['city'] or 'Unknown',
-                    isp=row['isp'] or 'Unknown',
-                    org=row['org'] or 'Unknown'
-                ))
+        from modules.map_generator import TacticalMapGenerator
         
+        map_points = _build_map_points(records)
         if map_points:
             map_gen = TacticalMapGenerator(theme=args.theme)
             map_gen.generate(map_points, target, args.output)
     
     # Export CSV if requested
     if args.csv:
-        df.to_csv(args.csv, index=False)
+        # Stream rows straight from the records - no intermediate table
+        with open(args.csv, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=records[0].keys(), lineterminator='\n')
+            writer.writeheader()
+            writer.writerows(records)
         console.print(f"[green][+] Data exported to CSV: [bold]{args.csv}[/bold][/green]")
     
-    return df
+    return records
 
 
-def print_summary(df: pd.DataFrame, target: str):
+def _build_map_points(records: List[dict]) -> list:
+    """Map points for records with valid coordinates (list of MapPoint)"""
+    from modules.map_generator import MapPoint
+    
+    # Geo fields belong to the IP, and many subdomains share one - fill in
+    # 'Unknown' once per distinct IP rather than per field per row
+    labels = {}
+    map_points = []
+    for r in records:
+        if r['lat'] is None or r['lon'] is None:
+            continue
+        
+        ip = r['ip']
+        label = labels.get(ip)
+        if label is None:
+            label = labels[ip] = (
+                r['country'] or 'Unknown',
+                r['city'] or 'Unknown',
+                r['isp'] or 'Unknown',
+                r['org'] or 'Unknown'
+            )
+        
+        map_points.append(MapPoint(r['subdomain'], ip, r['lat'], r['lon'], *label))
+    
+    return map_points
+
+
+def print_summary(records: List[dict], target: str):
     """Print reconnaissance summary table"""
     
     # Calculate statistics
-    total_subs = len(df)
-    unique_ips = df['ip'].nunique()
-    countries = df['country'].dropna().unique()
+    total_subs = len(records)
+    unique_ips = len({r['ip'] for r in records})
+    countries = {r['country'] for r in records if r['country']}
     
     # Top ISPs
-    top_isps = df['isp'].value_counts().head(5)
+    top_isps = Counter(r['isp'] for r in records if r['isp']).most_common(5)
     
     # Summary panel
     summary = Table(title="RECONNAISSANCE SUMMARY", show_header=True, header_style="bold cyan")
@@ -273,17 +326,17 @@ def print_summary(df: pd.DataFrame, target: str):
     summary.add_row("Live Subdomains", str(total_subs))
     summary.add_row("Unique IP Addresses", str(unique_ips))
     summary.add_row("Countries Spanned", str(len(countries)))
-    summary.add_row("Countries List", ", ".join(sorted(countries)[:10]) + ("..." if len(countries) > 10 else ""))
+    summary.add_row("Countries List", ", ".join(heapq.nsmallest(10, countries)) + ("..." if len(countries) > 10 else ""))
     
     console.print(summary)
     
     # Top ISPs table
-    if not top_isps.empty:
+    if top_isps:
         isp_table = Table(title="TOP INFRASTRUCTURE PROVIDERS", show_header=True, header_style="bold yellow")
         isp_table.add_column("ISP/Provider", style="yellow")
         isp_table.add_column("Hosts", style="white")
         
-        for isp, count in top_isps.items():
+        for isp, count in top_isps:
             isp_table.add_row(str(isp)[:50], str(count))
         
         console.print(isp_table)
@@ -291,17 +344,22 @@ def print_summary(df: pd.DataFrame, target: str):
     # Sample interesting targets
     console.print("\n[bold red]SAMPLE TARGETS (Potential Shadow IT):[/bold red]")
     
-    # Look for interesting patterns
-    interesting_patterns = ['dev', 'test', 'stage', 'admin', 'internal', 'vpn', 'api', 'beta', 'old', 'legacy']
-    interesting = df[df['subdomain'].str.contains('|'.join(interesting_patterns), case=False, na=False)]
+    # Look for interesting patterns (only the first 10 are shown - stop there).
+    # Only the labels left of the target are scanned: endpos skips the shared
+    # suffix without slicing, so 'api.com' or 'oldnavy.com' don't flag every host.
+    suffix_len = len(target) + 1
+    interesting = list(islice(
+        (r for r in records if _INTERESTING.search(r['subdomain'], 0, len(r['subdomain']) - suffix_len)),
+        10
+    ))
     
-    if not interesting.empty:
+    if interesting:
         sample_table = Table(show_header=True, header_style="bold red")
         sample_table.add_column("Subdomain", style="red")
         sample_table.add_column("IP", style="dim")
         sample_table.add_column("Location", style="cyan")
         
-        for _, row in interesting.head(10).iterrows():
+        for row in interesting:
             location = f"{row['city'] or '?'}, {row['country'] or '?'}"
             sample_table.add_row(row['subdomain'], row['ip'], location)
         
@@ -317,9 +375,9 @@ def main():
     args = parse_arguments()
     
     try:
-        df = run_reconnaissance(args)
+        records = run_reconnaissance(args)
         
-        if df is not None:
+        if records is not None:
             console.print(Panel(
                 "[bold green][+] RECONNAISSANCE COMPLETE[/bold green]\n"
                 f"[dim]Map saved to: {args.output}[/dim]",